@@ -1,7 +1,7 @@
 """
 Module: genpub_core.py
 
-This module implements the GenPub Core schema as a Python dataclass.
+This module implements the GenPub Core schema as a slotted Python class.
 The GenPub Core schema captures minimal metadata for distributed data lineage.
 Each schema version is uniquely identified by a persistent URI (`SCHEMA_URI`) and its derived UUIDv5 (`SCHEMA_ID`).
 
@@ -17,14 +17,17 @@ Fields:
                    Ensures each record has a globally unique identifier independent of its content or timestamps.
 
 Validation:
-  - `gen_name` and `gen_domain` are validated to ensure they are non-empty Unicode strings
-    without control characters (C0 and C1 blocks) or format characters (Unicode category Cf).
+  - `Record.validated(...)` and `Record.from_dict(...)` validate `gen_name` and `gen_domain` to ensure
+    they are non-empty Unicode strings without control characters (C0 and C1 blocks) or
+    format characters (Unicode category Cf).
+  - `Record(...)` does not validate; use it only for trusted input such as rows read back from storage.
+  - `validate_names(names)` applies the same check to a whole batch of names in one pass.
 
 Usage example:
     from datetime import datetime
     from genpub_core import Record, URI
 
-    record = Record(
+    record = Record.validated(
         gen_name="センサーA",
         gen_domain="例示.org",
         gen_time=datetime.utcnow(),
@@ -35,16 +38,18 @@ Usage example:
 
 """
 from __future__ import annotations
+import os
 import re
-from dataclasses import dataclass, field
 from datetime import datetime
-from typing import NewType
-from uuid import UUID, uuid4, uuid5, NAMESPACE_URL
+from typing import Iterable, NewType
+from uuid import UUID, SafeUUID, uuid5, NAMESPACE_URL
 
 # Persistent schema URI for GenPub Core v1
 SCHEMA_URI: str = "https://example.org/schema/genpub_core/v1"
 # Derive a UUIDv5 from the URL namespace and the schema URI
 SCHEMA_ID: UUID = uuid5(NAMESPACE_URL, SCHEMA_URI)
+# Canonical string form of SCHEMA_ID, as written by to_dict()
+_SCHEMA_ID_STR: str = str(SCHEMA_ID)
 
 # Alias for a generic URI type (e.g., udp://, s3://, file://)
 URI = NewType("URI", str)
@@ -58,40 +63,150 @@ _INVALID_NAME_CH_PATTERN = re.compile(
     r"\u2060-\u2064"          # format control
     r"\uFEFF]"                 # ZERO WIDTH NO-BREAK SPACE (BOM)
 )
+# Bound search method, looked up once for the validation hot path
+_INVALID_SEARCH = _INVALID_NAME_CH_PATTERN.search
+
+
+# Bit masks applying the RFC 4122 variant and version 4 to a random 128-bit integer
+_UUID4_CLEAR = ~(0xC000 << 48 | 0xF000 << 64)
+_UUID4_SET = 0x8000 << 48 | 0x4000 << 64
+
+
+def _fast_uuid4() -> UUID:
+    """
+    Generate a random UUID4 equivalent to uuid.uuid4().
+    Sets the UUID slots directly instead of going through UUID.__init__ argument checks.
+    """
+    u = object.__new__(UUID)
+    object.__setattr__(
+        u, "int", (int.from_bytes(os.urandom(16), "big") & _UUID4_CLEAR) | _UUID4_SET
+    )
+    object.__setattr__(u, "is_safe", SafeUUID.unknown)
+    return u
+
+
+def _validate(attr: str, val: object) -> None:
+    """
+    Validate that a name field is a non-empty string without disallowed characters.
+    """
+    if not isinstance(val, str) or not val:
+        raise ValueError(f"{attr} must be a non-empty string")
+    if _INVALID_SEARCH(val):
+        raise ValueError(f"{attr} contains invalid characters: {val!r}")
+
+
+def validate_names(names: Iterable[str]) -> None:
+    """
+    Validate a batch of gen_name/gen_domain values at once.
+    The names are joined with spaces (an allowed character) and scanned with a
+    single regex search instead of one search per name. The search stops at the
+    first invalid character, whose offset identifies the offending name.
+    A batch checked here can then be built with plain Record(...) calls.
+    Any iterable is accepted; it is copied to a tuple first, since it is scanned more than once.
+    """
+    names = tuple(names)
+    try:
+        joined = " ".join(names)
+    except TypeError:
+        joined = None
+    if joined is None or not all(names):
+        for i, val in enumerate(names):
+            _validate(f"names[{i}]", val)
+        raise ValueError("names must be non-empty strings")
+    m = _INVALID_SEARCH(joined)
+    if m:
+        # Map the match offset back to its name; each name is followed by one separator
+        pos = m.start()
+        for i, val in enumerate(names):
+            pos -= len(val) + 1
+            if pos < 0:
+                raise ValueError(f"names[{i}] contains invalid characters: {val!r}")
+
 
-@dataclass(slots=True)
 class Record:
     """
     GenPub Core Record:
     Represents a single unit of data generation and publication metadata.
 
     Attributes:
-        gen_name      : Name of the data generator (Unicode; validated).
-        gen_domain    : Domain or organization of the generator (Unicode; validated).
+        gen_name      : Name of the data generator (Unicode; validated by Record.validated).
+        gen_domain    : Domain or organization of the generator (Unicode; validated by Record.validated).
         gen_time      : Timestamp when data was generated (UTC).
         pub_locator   : Publication endpoint as a URI-like locator.
         pub_time      : Timestamp when data was published (UTC).
         data          : Payload or reference (raw bytes, JSON text, or hash).
         id            : UUID4 primary key for internal indexing and tracking.
     """
-    gen_name: str        # Name of the generator (Unicode; validated)
-    gen_domain: str      # Domain or organization of the generator (Unicode; validated)
-    gen_time: datetime   # Timestamp when data was generated (UTC)
-    pub_locator: URI     # Publication endpoint as a URI-like locator
-    pub_time: datetime   # Timestamp when data was published (UTC)
-    data: bytes          # Payload or reference (raw bytes, JSON text, or hash)
-    id: UUID = field(default_factory=uuid4)
-
-    def __post_init__(self) -> None:
+    __slots__ = (
+        "gen_name",     # Name of the generator (Unicode; validated by Record.validated)
+        "gen_domain",   # Domain or organization of the generator (Unicode; validated by Record.validated)
+        "gen_time",     # Timestamp when data was generated (UTC)
+        "pub_locator",  # Publication endpoint as a URI-like locator
+        "pub_time",     # Timestamp when data was published (UTC)
+        "data",         # Payload or reference (raw bytes, JSON text, or hash)
+        "id",           # UUID4 primary key; generated when not given
+    )
+
+    gen_name: str
+    gen_domain: str
+    gen_time: datetime
+    pub_locator: URI
+    pub_time: datetime
+    data: bytes
+    id: UUID
+
+    def __init__(
+        self,
+        gen_name: str,
+        gen_domain: str,
+        gen_time: datetime,
+        pub_locator: URI,
+        pub_time: datetime,
+        data: bytes,
+        id: UUID | None = None,
+    ) -> None:
+        """
+        Assign all fields without validation. A new UUID4 is generated when id is omitted.
+        Use Record.validated() for input that is not already known to be valid.
         """
-        Validate that gen_name and gen_domain do not contain disallowed characters.
+        self.gen_name = gen_name
+        self.gen_domain = gen_domain
+        self.gen_time = gen_time
+        self.pub_locator = pub_locator
+        self.pub_time = pub_time
+        self.data = data
+        self.id = _fast_uuid4() if id is None else id
+
+    @classmethod
+    def validated(cls, *args, **kwargs) -> Record:
         """
-        for attr in ("gen_name", "gen_domain"):
-            val = getattr(self, attr)
-            if not isinstance(val, str) or not val:
-                raise ValueError(f"{attr} must be a non-empty string")
-            if _INVALID_NAME_CH_PATTERN.search(val):
-                raise ValueError(f"{attr} contains invalid characters: {val!r}")
+        Construct a Record like Record(...), then validate that gen_name and
+        gen_domain do not contain disallowed characters.
+        """
+        r = cls(*args, **kwargs)
+        _validate("gen_name", r.gen_name)
+        _validate("gen_domain", r.gen_domain)
+        return r
+
+    def _astuple(self) -> tuple:
+        return (
+            self.gen_name, self.gen_domain, self.gen_time,
+            self.pub_locator, self.pub_time, self.data, self.id,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"Record(gen_name={self.gen_name!r}, gen_domain={self.gen_domain!r}, "
+            f"gen_time={self.gen_time!r}, pub_locator={self.pub_locator!r}, "
+            f"pub_time={self.pub_time!r}, data={self.data!r}, id={self.id!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._astuple() == other._astuple()
+
+    __hash__ = None  # mutable record, unhashable like the former dataclass
 
     def to_dict(self) -> dict:
         """
@@ -99,7 +214,7 @@ class Record:
         """
         return {
             "schema_uri": SCHEMA_URI,
-            "schema_id": str(SCHEMA_ID),
+            "schema_id": _SCHEMA_ID_STR,
             "id": str(self.id),
             "gen_name": self.gen_name,
             "gen_domain": self.gen_domain,
@@ -110,26 +225,34 @@ class Record:
         }
 
     @classmethod
-    def from_dict(cls, obj: dict) -> Record:
+    def from_dict(cls, obj: dict, validate: bool = True) -> Record:
         """
         Deserialize Record from dict (timestamps must be ISO strings).
         Verifies schema_uri matches this schema version.
+        Name validation can be skipped with validate=False for dicts from a trusted source.
         """
         if obj.get("schema_uri") != SCHEMA_URI:
             raise ValueError(
                 f"Schema URI mismatch: expected {SCHEMA_URI}, got {obj.get('schema_uri')}"
             )
-        schema_id = UUID(obj.get("schema_id", ""))
-        if schema_id != SCHEMA_ID:
-            raise ValueError(
-                f"Schema ID mismatch: expected {SCHEMA_ID}, got {schema_id}"
-            )
-        return cls(
+        if obj.get("schema_id") != _SCHEMA_ID_STR:
+            # Parse only non-canonical input, so other spellings of the same UUID still match
+            schema_id = UUID(obj.get("schema_id", ""))
+            if schema_id != SCHEMA_ID:
+                raise ValueError(
+                    f"Schema ID mismatch: expected {SCHEMA_ID}, got {schema_id}"
+                )
+        data = obj["data"]
+        if type(data) is not bytes:
+            # text is UTF-8 encoded; other bytes-like values (bytearray, memoryview,
+            # bytes subclasses) are copied to bytes; anything else raises TypeError
+            data = data.encode("utf-8") if isinstance(data, str) else memoryview(data).tobytes()
+        return (cls.validated if validate else cls)(
             gen_name=obj["gen_name"],
             gen_domain=obj["gen_domain"],
             gen_time=datetime.fromisoformat(obj["gen_time"]),
             pub_locator=URI(obj["pub_locator"]),
             pub_time=datetime.fromisoformat(obj["pub_time"]),
-            data=obj["data"] if isinstance(obj["data"], (bytes, bytearray)) else obj["data"].encode(),
-            id=UUID(obj.get("id", str(uuid4()))),
+            data=data,
+            id=UUID(obj["id"]) if "id" in obj else _fast_uuid4(),
         )
@@ -7,6 +7,11 @@ Features:
   - Initializes a local SQLite database file (`records.db`) with the required `records` table.
   - Defines `init_db()` to create the table if it does not already exist.
   - Defines `insert_record(r: Record)` to insert a `Record` instance into the database.
+  - Defines `insert_records(rs)` to insert many `Record` instances in a single transaction.
+  - Defines `iter_records()` to load stored rows back as `Record` instances.
+  - Reuses one module-level connection in WAL mode instead of reconnecting per call.
+    The connection is shared across threads and guarded by a module-level lock,
+    so several producer threads may insert concurrently.
   - Demonstrates usage when run as a script: creates a sample `Record`, inserts it, and prints confirmation.
 
 Usage:
@@ -15,7 +20,7 @@ Usage:
     import store_records
 
     store_records.init_db()
-    rec = Record(
+    rec = Record.validated(
         gen_name="sensor42",
         gen_domain="example.org",
         gen_time=datetime.utcnow(),
@@ -24,14 +29,22 @@ Usage:
         data=b"example payload"
     )
     store_records.insert_record(rec)
+    store_records.insert_records([rec2, rec3, ...])
+
+Call `init_db()` once at startup, before producer threads start inserting.
 
 Run from the command line:
     $ python store_records.py
 """
 
+from __future__ import annotations
 import sqlite3
-from datetime import datetime
-from genpub_core import Record
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Iterator
+from uuid import UUID
+from genpub_core import Record, URI
 
 # Path to the SQLite database file
 DB_PATH = "records.db"
@@ -39,25 +52,184 @@ DB_PATH = "records.db"
 # SQL statement to create the 'records' table matching GenPub Core schema
 DDL = """
 CREATE TABLE IF NOT EXISTS records (
-    id            TEXT PRIMARY KEY,
+    id            BLOB PRIMARY KEY,
     gen_name      TEXT NOT NULL,
     gen_domain    TEXT NOT NULL,
-    gen_time      TEXT NOT NULL,
+    gen_time      INTEGER NOT NULL,
     pub_locator   TEXT NOT NULL,
-    pub_time      TEXT NOT NULL,
+    pub_time      INTEGER NOT NULL,
     data          BLOB NOT NULL
 );
 """
 
+# Timestamps are stored as integer microseconds since this (naive UTC) epoch
+_EPOCH = datetime(1970, 1, 1)
+_ONE_US = timedelta(microseconds=1)
+
+# SQL statement to insert one row into the 'records' table
+INSERT_SQL = "INSERT INTO records VALUES (?,?,?,?,?,?,?)"
+
+# Number of rows fetched per lock acquisition in iter_records()
+_FETCH_SIZE = 256
+
+# Shared connection, opened lazily by _conn(), and its reusable insert cursor
+_CONN: sqlite3.Connection | None = None
+_CUR: sqlite3.Cursor | None = None
+# Serializes all use of _CONN/_CUR; callers of _conn() and _cursor() must hold it
+_LOCK = threading.Lock()
+
+
+def _conn() -> sqlite3.Connection:
+    """
+    Return the module-level SQLite connection, opening it on first use.
+    The connection runs in autocommit mode with WAL journaling and
+    synchronous=NORMAL, so commits do not fsync the database file.
+    It may be used from any thread while _LOCK is held.
+    """
+    global _CONN, _CUR
+    if _CONN is None:
+        _CONN = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+        _CONN.execute("PRAGMA journal_mode=WAL")
+        _CONN.execute("PRAGMA synchronous=NORMAL")
+        _CUR = _CONN.cursor()
+    return _CONN
+
+
+def _cursor() -> sqlite3.Cursor:
+    """
+    Return the persistent cursor of the module-level connection.
+    Reusing it avoids allocating a new Cursor for every single-row insert;
+    the prepared INSERT statement itself comes from the connection's statement cache.
+    """
+    if _CUR is None:
+        _conn()
+    return _CUR
+
+
+def close_db() -> None:
+    """
+    Close the module-level connection if it is open.
+    Any iter_records() iterator still open raises on its next fetch.
+    """
+    global _CONN, _CUR
+    with _LOCK:
+        if _CONN is not None:
+            _CUR.close()
+            _CONN.close()
+            _CONN = _CUR = None
+
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection) -> Iterator[None]:
+    """
+    Run the enclosed statements in one explicit transaction on an autocommit connection.
+    """
+    conn.execute("BEGIN")
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def _to_us(dt: datetime) -> int:
+    """
+    Convert a datetime to integer microseconds since the Unix epoch.
+    Naive values are taken as UTC; aware values are converted to UTC first.
+    Uses exact integer arithmetic, so no precision is lost to float timestamps.
+    """
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return (dt - _EPOCH) // _ONE_US
+
+
+def _from_us(us: int) -> datetime:
+    """
+    Convert integer microseconds since the Unix epoch to a naive UTC datetime.
+    """
+    return _EPOCH + timedelta(microseconds=us)
+
+
+def _row(r: Record) -> tuple:
+    """
+    Convert a Record into the parameter tuple for INSERT_SQL.
+    """
+    return (
+        r.id.bytes,
+        r.gen_name,
+        r.gen_domain,
+        _to_us(r.gen_time),
+        r.pub_locator,
+        _to_us(r.pub_time),
+        r.data,
+    )
+
+
+def _record_from_row(row: tuple) -> Record:
+    """
+    Rebuild a Record from a 'records' row in column order.
+    Names are not re-validated; the row comes from our own store.
+    """
+    return Record(
+        gen_name=row[1],
+        gen_domain=row[2],
+        gen_time=_from_us(row[3]),
+        pub_locator=URI(row[4]),
+        pub_time=_from_us(row[5]),
+        data=row[6],
+        id=UUID(bytes=row[0]),
+    )
+
+
+def _migrate_legacy_row(row: tuple) -> tuple:
+    """
+    Convert a row of an older 'records' layout (TEXT ids and/or ISO 8601 TEXT
+    timestamps) to the current BLOB id / INTEGER microsecond layout.
+    """
+    rid, gen_name, gen_domain, gen_time, pub_locator, pub_time, data = row
+    if isinstance(rid, str):
+        rid = UUID(rid).bytes
+    if isinstance(gen_time, str):
+        gen_time = _to_us(datetime.fromisoformat(gen_time))
+    if isinstance(pub_time, str):
+        pub_time = _to_us(datetime.fromisoformat(pub_time))
+    return (rid, gen_name, gen_domain, gen_time, pub_locator, pub_time, data)
+
+
+def _migrate_legacy_table(conn: sqlite3.Connection) -> None:
+    """
+    Convert a 'records' table created with a TEXT id column or TEXT timestamp
+    columns to 16-byte BLOB ids and INTEGER microsecond timestamps.
+    Tables that already use the current layout are left unchanged.
+    """
+    col_types = {col[1]: col[2].upper() for col in conn.execute("PRAGMA table_info(records)")}
+    if not col_types or (
+        col_types["id"] != "TEXT"
+        and col_types["gen_time"] != "TEXT"
+        and col_types["pub_time"] != "TEXT"
+    ):
+        return
+    with _transaction(conn):
+        conn.execute("ALTER TABLE records RENAME TO records_legacy")
+        conn.execute(DDL)
+        conn.executemany(
+            INSERT_SQL,
+            map(_migrate_legacy_row, conn.execute("SELECT * FROM records_legacy")),
+        )
+        conn.execute("DROP TABLE records_legacy")
+
+
 def init_db() -> None:
     """
     Initialize the SQLite database by creating the 'records' table.
-    If the table already exists, this function has no effect.
+    If the table already exists, this function has no effect, except that a
+    table with TEXT ids or TEXT timestamps is migrated to the current layout.
     """
-    conn = sqlite3.connect(DB_PATH)
-    conn.execute(DDL)
-    conn.commit()
-    conn.close()
+    with _LOCK:
+        conn = _conn()
+        _migrate_legacy_table(conn)
+        conn.execute(DDL)
 
 
 def insert_record(r: Record) -> None:
@@ -68,35 +240,62 @@ def insert_record(r: Record) -> None:
         r (Record): An instance of genpub_core.Record to be stored.
 
     The Record's fields are serialized as follows:
-      - r.id           -> TEXT (UUID string)
+      - r.id           -> BLOB (16-byte UUID)
       - r.gen_name     -> TEXT
       - r.gen_domain   -> TEXT
-      - r.gen_time     -> TEXT (ISO 8601 UTC string)
+      - r.gen_time     -> INTEGER (microseconds since the Unix epoch, UTC)
       - r.pub_locator  -> TEXT (URI string)
-      - r.pub_time     -> TEXT (ISO 8601 UTC string)
+      - r.pub_time     -> INTEGER (microseconds since the Unix epoch, UTC)
       - r.data         -> BLOB
     """
-    conn = sqlite3.connect(DB_PATH)
-    conn.execute(
-        "INSERT INTO records VALUES (?,?,?,?,?,?,?)",
-        (
-            str(r.id),
-            r.gen_name,
-            r.gen_domain,
-            r.gen_time.isoformat(),
-            r.pub_locator,
-            r.pub_time.isoformat(),
-            r.data,
-        ),
-    )
-    conn.commit()
-    conn.close()
+    params = _row(r)
+    with _LOCK:
+        _cursor().execute(INSERT_SQL, params)
+
+
+def insert_records(rs: Iterable[Record]) -> None:
+    """
+    Insert many GenPub Core Records in a single transaction.
+
+    Args:
+        rs (Iterable[Record]): Records to be stored, serialized as in insert_record().
+
+    Either all records are stored or, if any insert fails, none are.
+    Rows are serialized before the connection lock is taken.
+    """
+    rows = [_row(r) for r in rs]
+    with _LOCK:
+        conn = _conn()
+        with _transaction(conn):
+            conn.executemany(INSERT_SQL, rows)
+
+
+def iter_records() -> Iterator[Record]:
+    """
+    Yield every stored GenPub Core Record, with timestamps as naive UTC datetimes.
+    Rows are fetched in batches, releasing the connection lock between batches.
+    Calling close_db() while the iterator is still open makes its next fetch
+    raise sqlite3.ProgrammingError.
+    """
+    with _LOCK:
+        cur = _conn().execute("SELECT * FROM records")
+    try:
+        while True:
+            with _LOCK:
+                rows = cur.fetchmany(_FETCH_SIZE)
+            if not rows:
+                break
+            for row in rows:
+                yield _record_from_row(row)
+    finally:
+        with _LOCK:
+            cur.close()
 
 
 if __name__ == "__main__":
     # Example usage: initialize DB and insert a sample record
     init_db()
-    sample = Record(
+    sample = Record.validated(
         gen_name="sensor42",
         gen_domain="example.org",
         gen_time=datetime.utcnow(),